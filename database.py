@@ -9,9 +9,12 @@ Under normal circumstances, the main module creates one NEODatabase from the
 data on NEOs and close approaches extracted by `extract.load_neos` and
 `extract.load_approaches`.
 """
+from bisect import bisect_left, bisect_right
 from typing import List
+import operator
+
 from models import NearEarthObject, CloseApproach
-from filters import AttributeFilter
+from filters import AttributeFilter, between, compile_filters, inline_attribute
 
 
 class NEODatabase:
@@ -39,26 +42,36 @@ class NEODatabase:
         constructor modifies the supplied NEOs and close approaches to link them
         together - after it's done, the `.approaches` attribute of each NEO has
         a collection of that NEO's close approaches, and the `.neo` attribute of
-        each close approach references the appropriate NEO.
+        each close approach references the appropriate NEO. A close approach
+        whose designation matches no NEO keeps `.neo` set to None and is left
+        out of `query` results.
 
         :param neos: A collection of `NearEarthObject`s.
         :param approaches: A collection of `CloseApproach`es.
         """
         self._neos = neos
-        self._approaches = approaches
-
-        self._data_map = {}
 
-        # Link together the NEOs and their close approaches.
-        for neo in self._neos:
-            designation = neo.designation
-            self._data_map[designation] = neo
-
-        for approach in self._approaches:
-            designation = approach.designation
-            if self._data_map[designation]:
-                approach.neo = self._data_map[designation]
-                self._data_map[designation].approaches.append(approach)
+        # Index the NEOs by primary designation and by name.
+        self._neo_by_des = {neo.designation: neo for neo in self._neos}
+        self._neo_by_name = {neo.name: neo for neo in self._neos if neo.name}
+
+        # Link together the NEOs and their close approaches. Approaches whose
+        # designation matches no known NEO are left unlinked and aren't queryable.
+        neo_by_des = self._neo_by_des
+        linked = []
+        for approach in approaches:
+            neo = neo_by_des.get(approach._designation)
+            if neo is not None:
+                approach.neo = neo
+                neo.approaches.append(approach)
+                linked.append(approach)
+
+        # Keep the approaches sorted by date (a stable, near-linear sort on the
+        # usually time-ordered input) so date-bounded queries can bisect to
+        # the matching slice instead of scanning every approach.
+        linked.sort(key=operator.attrgetter('date_ord'))
+        self._approaches = linked
+        self._date_ords = [approach.date_ord for approach in self._approaches]
 
     def get_neo_by_designation(self, designation: str) -> NearEarthObject:
         """Find and return an NEO by its primary designation.
@@ -73,11 +86,7 @@ class NEODatabase:
         :param designation: The primary designation of the NEO to search for.
         :return: The `NearEarthObject` with the desired primary designation, or `None`.
         """
-        for neo in self._neos:
-            if neo.designation == designation:
-                return neo
-
-        return None
+        return self._neo_by_des.get(designation)
 
     def get_neo_by_name(self, name: str) -> NearEarthObject:
         """Find and return an NEO by its name.
@@ -93,10 +102,7 @@ class NEODatabase:
         :param name: The name, as a string, of the NEO to search for.
         :return: The `NearEarthObject` with the desired name, or `None`.
         """
-        for neo in self._neos:
-            if neo.name == name:
-                return neo
-        return None
+        return self._neo_by_name.get(name) if name else None
 
     def query(self, filters: List[AttributeFilter]
               = ()) -> List[CloseApproach]:
@@ -113,24 +119,47 @@ class NEODatabase:
         :param filters: A collection of filters capturing user-specified criteria.
         :return: A stream of matching `CloseApproach` objects.
         """
-        for approach in self._approaches:
-            if self.filter(approach, filters):
-                yield approach
-
-    def filter(
-            self,
-            approach: CloseApproach,
-            filters: List[AttributeFilter]) -> bool:
-        """Apply filters.
-
-        This return True or False depending if the approach passed
-        all the filters
+        start, end, filters = self._split_date_bounds(filters)
+        approaches = self._approaches
+        if start is not None or end is not None:
+            lo = 0 if start is None else bisect_left(self._date_ords, start)
+            hi = len(approaches) if end is None else bisect_right(self._date_ords, end)
+            approaches = approaches[lo:hi]
+
+        if filters:
+            yield from filter(compile_filters(filters), approaches)
+        else:
+            yield from approaches
+
+    @staticmethod
+    def _split_date_bounds(filters):
+        """Separate date filters that reduce to an inclusive range of date ordinals.
 
         :param filters: A collection of filters capturing user-specified criteria.
-        :param approach: A close approach
-        :return: True or False
+        :return: The start and end ordinals (each possibly None) and a tuple of the remaining filters.
         """
-        for filter in filters:
-            if filter(approach) is False:
-                return False
-        return True
+        start = end = None
+        remaining = []
+        for approach_filter in filters:
+            # Only filters that still compare the date ordinal describe a range
+            # of the sorted approaches; anything customized is applied as-is.
+            if inline_attribute(approach_filter) != 'date_ord':
+                remaining.append(approach_filter)
+                continue
+            op, value = approach_filter.op, approach_filter.value
+            if op is operator.eq:
+                low, high = value, value
+            elif op is between:
+                low, high = value
+            elif op is operator.ge:
+                low, high = value, None
+            elif op is operator.le:
+                low, high = None, value
+            else:
+                remaining.append(approach_filter)
+                continue
+            if low is not None:
+                start = low if start is None else max(start, low)
+            if high is not None:
+                end = high if end is None else min(end, high)
+        return start, end, tuple(remaining)
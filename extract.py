@@ -11,8 +11,14 @@ The main module calls these functions with the arguments provided at the command
 line, and uses the resulting collections to build an `NEODatabase`.
 """
 from typing import List
+from sys import intern
 import csv
-import json
+
+try:
+    # orjson parses the large close approach file considerably faster.
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 from models import NearEarthObject, CloseApproach
 
@@ -23,20 +29,23 @@ def load_neos(neo_csv_path: str) -> List[NearEarthObject]:
     :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
     :return: A list of `NearEarthObject`s.
     """
-    # TODO: Load NEO data from the given CSV file.
     neo_objects = []
+    make_neo = NearEarthObject
     with open(neo_csv_path) as neo_input:
-        reader = csv.DictReader(neo_input)
-        for neo_object in reader:
-            designation, name, diameter, hazardous = neo_object['pdes'],\
-                neo_object['name'], neo_object['diameter'], neo_object['pha']
+        reader = csv.reader(neo_input)
+        header = next(reader)
+        i_pdes, i_name, i_diameter, i_pha = header.index('pdes'), \
+            header.index('name'), header.index('diameter'), header.index('pha')
+        for row in reader:
+            designation, name, diameter, hazardous = intern(row[i_pdes]), \
+                row[i_name], row[i_diameter], row[i_pha]
             if not name:
                 name = None
             if not diameter:
                 diameter = 'NaN'
             hazardous = True if hazardous == 'Y' else False
             neo_objects.append(
-                NearEarthObject(
+                make_neo(
                     designation,
                     name,
                     float(diameter),
@@ -51,14 +60,20 @@ def load_approaches(cad_json_path: str) -> List[CloseApproach]:
     :return: A collection of `CloseApproach`es.
     """
     cad_objects = []
-    with open(cad_json_path) as cad:
-        json_dict = json.load(cad)
-        for cad in json_dict['data']:
-            designation, time, dist, vel = cad[0], cad[3], cad[4], cad[7]
-            cad_objects.append(
-                CloseApproach(
-                    designation,
-                    time,
-                    float(dist),
-                    float(vel)))
+    with open(cad_json_path, 'rb') as cad_input:
+        rows = _json.loads(cad_input.read())['data']
+
+    # Pop rows off the end of the parsed list so that each one is released as
+    # soon as its `CloseApproach` exists, rather than keeping the whole parsed
+    # document alive alongside the resulting objects.
+    rows.reverse()
+    while rows:
+        cad = rows.pop()
+        designation, time, dist, vel = intern(cad[0]), cad[3], cad[4], cad[7]
+        cad_objects.append(
+            CloseApproach(
+                designation,
+                time,
+                float(dist),
+                float(vel)))
     return cad_objects
@@ -11,11 +11,15 @@ from a comparator (from the `operator` module), a reference value, and a class
 method `get` that subclasses can override to fetch an attribute of interest from
 the supplied `CloseApproach`.
 
+The `compile_filters` function turns such a collection into one specialized
+predicate function, which `query` uses to test each close approach.
+
 The `limit` function simply limits the maximum number of values produced by an
 iterator.
 
 You'll edit this file in Tasks 3a and 3c.
 """
+import datetime
 import operator
 from typing import List
 from itertools import islice
@@ -39,10 +43,17 @@ class AttributeFilter:
     infix notation).
 
     Concrete subclasses can override the `get` classmethod to provide custom
-    behavior to fetch a desired attribute from the given `CloseApproach`.
+    behavior to fetch a desired attribute from the given `CloseApproach`, and
+    may set the `attribute` class attribute to the dotted path of the attribute
+    that `get` returns, which lets the filter use faster lookups in its place.
+    A `get` defined further down the class hierarchy than `attribute` takes
+    precedence, so a subclass that overrides `get` alone keeps its custom
+    behavior, while one that declares `attribute` alone uses that attribute.
     """
 
-    def __init__(self, op: str, value):
+    attribute = None
+
+    def __init__(self, op: str, value, getter=None):
         """Construct a new `AttributeFilter` from an binary predicate and a reference value.
 
         The reference value will be supplied as the second (right-hand side)
@@ -52,13 +63,24 @@ class AttributeFilter:
 
         :param op: A 2-argument predicate comparator (such as `operator.le`).
         :param value: The reference value to compare against.
+        :param getter: A 1-argument callable overriding the attribute lookup of this filter.
         """
         self.op: str = op
         self.value = value
+        # Resolve the attribute lookup once, instead of binding `get` per call.
+        attribute_cls = _defining_class(type(self), 'attribute')
+        get_cls = _defining_class(type(self), 'get')
+        if getter is not None or (
+                get_cls is not attribute_cls and issubclass(get_cls, attribute_cls)):
+            # A custom lookup means the attribute path no longer describes this filter.
+            self.attribute = None
+        if getter is None:
+            getter = operator.attrgetter(self.attribute) if self.attribute else self.get
+        self.getter = getter
 
     def __call__(self, approach):
         """Invoke `self(approach)`."""
-        return self.op(self.get(approach), self.value)
+        return self.op(self.getter(approach), self.value)
 
     @classmethod
     def get(cls, approach: CloseApproach):
@@ -74,7 +96,18 @@ class AttributeFilter:
 
     def __repr__(self):
         """Return `repr(self)`, a computer-readable string representation of this object."""
-        return f"{self.__class__.__name__}(op=operator.{self.op.__name__}, value={self.value})"
+        op_name = self.op.__name__
+        if getattr(operator, op_name, None) is self.op:
+            op_name = f"operator.{op_name}"
+        return f"{self.__class__.__name__}(op={op_name}, value={self.value})"
+
+
+def _defining_class(cls, name: str):
+    """Return the class in the MRO of `cls` whose namespace defines `name`."""
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+    return None
 
 
 def create_filters(
@@ -119,37 +152,104 @@ def create_filters(
     """
     filters = []
 
+    # `query` stops at the first failing filter, so cheap and selective
+    # criteria go first.
+    if hazardous is not None:
+        filters.append(HazardousFilter(operator.eq, hazardous))
+
     if date is not None:
         filters.append(DateFilter(operator.eq, date))
 
-    if start_date is not None:
-        filters.append(DateFilter(operator.ge, start_date))
+    filters.append(_range_filter(DateFilter, start_date, end_date))
+    filters.append(_range_filter(DistanceFilter, distance_min, distance_max))
+    filters.append(_range_filter(VelocityFilter, velocity_min, velocity_max))
+    filters.append(_range_filter(DiameterFilter, diameter_min, diameter_max))
 
-    if end_date is not None:
-        filters.append(DateFilter(operator.le, end_date))
+    return [f for f in filters if f is not None]
 
-    if distance_min is not None:
-        filters.append(DistanceFilter(operator.ge, distance_min))
 
-    if distance_max is not None:
-        filters.append(DistanceFilter(operator.le, distance_max))
+def between(value, bounds) -> bool:
+    """Return whether `value` lies within the inclusive `(low, high)` bounds.
 
-    if velocity_min is not None:
-        filters.append(VelocityFilter(operator.ge, velocity_min))
+    Used as the operator of a filter with both a lower and an upper bound, so
+    that the pair costs one filter call and one chained comparison.
+    """
+    low, high = bounds
+    return low <= value <= high
 
-    if velocity_max is not None:
-        filters.append(VelocityFilter(operator.le, velocity_max))
 
-    if diameter_min is not None:
-        filters.append(DiameterFilter(operator.ge, diameter_min))
+def _range_filter(filter_cls, low=None, high=None):
+    """Create a single filter for an inclusive range, either end of which may be unset.
 
-    if diameter_max is not None:
-        filters.append(DiameterFilter(operator.le, diameter_max))
+    :param filter_cls: The `AttributeFilter` subclass to instantiate.
+    :param low: The lower bound, or None.
+    :param high: The upper bound, or None.
+    :return: A filter checking the given bounds, or None if neither is set.
+    """
+    if low is not None and high is not None:
+        return filter_cls(between, (low, high))
+    if low is not None:
+        return filter_cls(operator.ge, low)
+    if high is not None:
+        return filter_cls(operator.le, high)
+    return None
 
-    if hazardous is not None:
-        filters.append(HazardousFilter(operator.eq, hazardous))
 
-    return filters
+def inline_attribute(approach_filter):
+    """Return the attribute path that a filter compares, if it may be inlined.
+
+    A filter may be replaced by a direct comparison of this attribute only if
+    it is an `AttributeFilter` that still uses `AttributeFilter.__call__`; any
+    other callable (including subclasses overriding `__call__`) must be called.
+
+    :param approach_filter: A 1-argument predicate on a `CloseApproach`.
+    :return: The dotted attribute path, or None if the filter must be called.
+    """
+    if (isinstance(approach_filter, AttributeFilter)
+            and type(approach_filter).__call__ is AttributeFilter.__call__):
+        return getattr(approach_filter, 'attribute', None)
+    return None
+
+
+# Source operators for the comparators that `compile_filters` can inline.
+_INLINE_OPS = {operator.eq: '==', operator.ge: '>=', operator.le: '<='}
+
+
+def compile_filters(filters: List[AttributeFilter]):
+    """Specialize a collection of filters into a single predicate function.
+
+    The active filters are fixed for a whole query, so rather than calling each
+    filter on every approach, this generates the source of one `match(a)`
+    function that evaluates all of the criteria in order as inline comparisons
+    (e.g. `a.neo.hazardous == v0 and v1 <= a.distance <= v2`). Reference values
+    are bound as default arguments, so they are fast local lookups. Filters with
+    a custom getter, comparator or `__call__`, and other 1-argument predicates,
+    are called as-is from within the function.
+
+    :param filters: A collection of filters capturing user-specified criteria.
+    :return: A 1-argument predicate on a `CloseApproach`.
+    """
+    clauses = []
+    values = {}
+    for approach_filter in filters:
+        name = f'v{len(values)}'
+        attribute = inline_attribute(approach_filter)
+        op = approach_filter.op if attribute else None
+        if attribute and op is between:
+            values[name + 'lo'], values[name + 'hi'] = approach_filter.value
+            clauses.append(f'{name}lo <= a.{attribute} <= {name}hi')
+        elif attribute and op in _INLINE_OPS:
+            values[name] = approach_filter.value
+            clauses.append(f'a.{attribute} {_INLINE_OPS[op]} {name}')
+        else:
+            values[name] = approach_filter
+            clauses.append(f'{name}(a)')
+
+    params = ''.join(f', {name}={name}' for name in values)
+    source = f"def match(a{params}):\n    return {' and '.join(clauses) or 'True'}\n"
+    namespace = {}
+    exec(compile(source, '<filters>', 'exec'), dict(values), namespace)
+    return namespace['match']
 
 
 def limit(iterator, n: int = None):
@@ -167,23 +267,55 @@ def limit(iterator, n: int = None):
 
 
 class DateFilter(AttributeFilter):
-    """A subclass of `AttributeFilter` for filtering by date."""
+    """A subclass of `AttributeFilter` for filtering by date.
+
+    Dates are compared as proleptic Gregorian ordinals, which are plain ints.
+    The reference value may be given as a `datetime.date` (or, for `between`, a
+    pair of them) and is converted to ordinals on construction; ints are taken
+    to be ordinals already. Filters with a custom getter, or subclasses that
+    override `get`, keep the reference value as given.
+    """
+
+    attribute = 'date_ord'
+
+    def __init__(self, op, value, getter=None):
+        """Construct a new `DateFilter`, converting `date` reference values to ordinals.
+
+        :param op: A 2-argument predicate comparator (such as `operator.le`).
+        :param value: The reference `date` or ordinal (or a pair of them) to compare against.
+        :param getter: A 1-argument callable overriding the attribute lookup of this filter.
+        """
+        super().__init__(op, value, getter)
+        if self.attribute == 'date_ord':
+            if isinstance(value, tuple):
+                self.value = tuple(_to_ordinal(bound) for bound in value)
+            else:
+                self.value = _to_ordinal(value)
 
     @classmethod
-    def get(cls, approach: CloseApproach) -> str:
-        """Get date attribute a close approach.
+    def get(cls, approach: CloseApproach) -> int:
+        """Get date attribute a close approach, as an ordinal.
 
         Overrides `get` method of the parent class AttributeFilter.
         .
         :param approach: A `CloseApproach` on which to evaluate this filter.
         :return: The value of an attribute of interest, comparable to `self.value` via `self.op`.
         """
-        return approach.time.date()
+        return approach.date_ord
+
+
+def _to_ordinal(value):
+    """Return the ordinal of a `datetime.date`, or the value unchanged otherwise."""
+    if isinstance(value, datetime.date):
+        return value.toordinal()
+    return value
 
 
 class DistanceFilter(AttributeFilter):
     """A subclass of `AttributeFilter` for filtering by distance."""
 
+    attribute = 'distance'
+
     @classmethod
     def get(cls, approach: CloseApproach) -> float:
         """Get distance attribute a close approach.
@@ -199,6 +331,8 @@ class DistanceFilter(AttributeFilter):
 class VelocityFilter(AttributeFilter):
     """A subclass of `AttributeFilter` for filtering by velocity."""
 
+    attribute = 'velocity'
+
     @classmethod
     def get(cls, approach: CloseApproach) -> float:
         """Get velocity attribute a close approach.
@@ -214,6 +348,8 @@ class VelocityFilter(AttributeFilter):
 class DiameterFilter(AttributeFilter):
     """A subclass of `AttributeFilter` for filtering by diameter."""
 
+    attribute = 'neo.diameter'
+
     @classmethod
     def get(cls, approach: CloseApproach) -> float:
         """Get diameter attribute a close approach.
@@ -229,6 +365,8 @@ class DiameterFilter(AttributeFilter):
 class HazardousFilter(AttributeFilter):
     """A subclass of `AttributeFilter` for filtering by hazardous flag."""
 
+    attribute = 'neo.hazardous'
+
     @classmethod
     def get(cls, approach: CloseApproach) -> bool:
         """Get hazardous attribute a close approach.
@@ -12,6 +12,13 @@ provide that level of resolution, so the output format also will not.
 """
 import datetime
 
+# NASA's English month abbreviations, mapped to month numbers.
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1)
+}
+
 
 def cd_to_datetime(calendar_date):
     """Convert a NASA-formatted calendar date/time description into a datetime.
@@ -23,10 +30,27 @@ def cd_to_datetime(calendar_date):
 
     This will become the Python object `datetime.datetime(2020, 12, 31, 12, 0)`.
 
+    This is called once per close approach, so the string is split by hand
+    rather than parsed with the much slower `datetime.strptime`. As with
+    `strptime`, month abbreviations are matched case-insensitively and
+    malformed input raises a `ValueError`.
+
     :param calendar_date: A calendar date in YYYY-bb-DD hh:mm format.
     :return: A naive `datetime` corresponding to the given calendar date and time.
+    :raises ValueError: If `calendar_date` isn't in YYYY-bb-DD hh:mm format.
     """
-    return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
+    date_part, time_part = calendar_date.split(' ')
+    year, month, day = date_part.split('-')
+    hour, minute = time_part.split(':')
+    # `int` alone would also accept signs, underscores and short years.
+    if not (len(year) == 4 and year.isdigit()
+            and all(0 < len(field) <= 2 and field.isdigit() for field in (day, hour, minute))):
+        raise ValueError(f"'{calendar_date}' is not in YYYY-bb-DD hh:mm format.")
+    try:
+        month = _MONTHS[month.capitalize()]
+    except KeyError:
+        raise ValueError(f"'{calendar_date}' has an unknown month abbreviation.") from None
+    return datetime.datetime(int(year), month, int(day), int(hour), int(minute))
 
 
 def datetime_to_str(dt):
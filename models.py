@@ -32,20 +32,20 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches')
+
     def __init__(
             self,
             pdes: str,
             name: str = None,
             diameter: float = float('nan'),
-            hazardous: bool = False,
-            **info):
+            hazardous: bool = False):
         """Create a new `NearEarthObject`.
 
         :param pdes: A designation for the NearEarthObject
         :param name: Name of the NearEarthObject, may be none or empty string
         :param diameter: Diameter of the NearEarthObject, may be none
         :param pha: NearEarthObject is hazardous or not
-        :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
         self.designation = pdes
         self.name = name
@@ -96,24 +96,26 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('_designation', 'time', 'date_ord', 'distance', 'velocity', 'neo')
+
     def __init__(
             self,
             pdes: str,
             time: str,
             distance: float = float('nan'),
             velocity: float = float('nan'),
-            neo: NearEarthObject = None,
-            **info):
+            neo: NearEarthObject = None):
         """Create a new `CloseApproach`.
 
         :param des: A designation for the Object
         :param cd: Time of close-approach
         :param dist: Nominal approach distance
         :param v_rel: Velocity relative to the approach body at close approach (km/s)
-        :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
         self._designation = pdes
         self.time = cd_to_datetime(time)
+        # Cache the calendar date's ordinal, which date filters compare against.
+        self.date_ord = self.time.toordinal()
         self.distance = distance
         self.velocity = velocity
 
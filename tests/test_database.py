@@ -17,6 +17,8 @@ import unittest
 
 from extract import load_neos, load_approaches
 from database import NEODatabase
+from filters import create_filters
+from models import NearEarthObject, CloseApproach
 
 
 # Paths to the test data files.
@@ -114,6 +116,23 @@ class TestDatabase(unittest.TestCase):
         nonexistent = self.db.get_neo_by_name('not-real-name')
         self.assertIsNone(nonexistent)
 
+    def test_get_neo_by_name_empty(self):
+        self.assertIsNone(self.db.get_neo_by_name(''))
+        self.assertIsNone(self.db.get_neo_by_name(None))
+
+    def test_database_construction_skips_approaches_of_unknown_neos(self):
+        neo = NearEarthObject('433', 'Eros', 16.84, False)
+        known = CloseApproach('433', '2020-Jan-01 00:00', 0.2, 5.0)
+        orphan = CloseApproach('not-real-designation', '2020-Jan-01 00:00', 0.1, 10.0)
+        db = NEODatabase([neo], [known, orphan])
+        self.assertIs(known.neo, neo)
+        self.assertIsNone(orphan.neo)
+        self.assertEqual(neo.approaches, [known])
+
+        self.assertEqual(list(db.query()), [known])
+        for filters in (create_filters(hazardous=False), create_filters(diameter_min=1.0)):
+            self.assertEqual(list(db.query(filters)), [known])
+
 
 if __name__ == '__main__':
     unittest.main()
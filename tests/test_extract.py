@@ -18,6 +18,7 @@ import unittest
 
 from extract import load_neos, load_approaches
 from models import NearEarthObject, CloseApproach
+from helpers import cd_to_datetime
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -118,5 +119,21 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsInstance(approach.velocity, float)
 
 
+class TestCalendarDateParsing(unittest.TestCase):
+    def test_cd_to_datetime_parses_nasa_format(self):
+        self.assertEqual(cd_to_datetime('2020-Dec-31 12:00'),
+                         datetime.datetime(2020, 12, 31, 12, 0))
+        self.assertEqual(cd_to_datetime('1900-jan-01 00:07'),
+                         datetime.datetime(1900, 1, 1, 0, 7))
+
+    def test_cd_to_datetime_rejects_malformed_dates(self):
+        for calendar_date in ('2020-Foo-01 00:00', '2020-12-01 00:00',
+                              '2020-Feb-30 00:00', '2020-Dec-31',
+                              '2020-Dec-+1 00:00', '2020-Dec-01 0_0:00',
+                              '20-Dec-01 00:00'):
+            with self.assertRaises(ValueError):
+                cd_to_datetime(calendar_date)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,12 +13,13 @@ To run these tests from the project root, run::
 These tests should pass when Tasks 3a and 3b are complete.
 """
 import datetime
+import operator
 import pathlib
 import unittest
 
 from database import NEODatabase
 from extract import load_neos, load_approaches
-from filters import create_filters
+from filters import create_filters, between, AttributeFilter, DateFilter, DistanceFilter, VelocityFilter
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -528,6 +529,162 @@ class TestQuery(unittest.TestCase):
         received = set(self.db.query(filters))
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
+    def test_query_with_custom_getter_and_operator(self):
+        velocity_threshold = 15
+
+        expected = set(
+            approach for approach in self.approaches
+            if approach.velocity > velocity_threshold
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = [VelocityFilter(operator.gt, velocity_threshold)]
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_custom_filter_and_date_bounds(self):
+        class NameLengthFilter(AttributeFilter):
+            @classmethod
+            def get(cls, approach):
+                return len(approach.neo.fullname)
+
+        start_date = datetime.date(2020, 3, 1)
+        end_date = datetime.date(2020, 6, 30)
+        name_length = 12
+        velocity_max = 15
+
+        expected = set(
+            approach for approach in self.approaches
+            if start_date <= approach.time.date() <= end_date
+            and len(approach.neo.fullname) >= name_length
+            and approach.velocity <= velocity_max
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = create_filters(start_date=start_date, end_date=end_date)
+        filters.append(NameLengthFilter(operator.ge, name_length))
+        filters.append(AttributeFilter(operator.le, velocity_max,
+                                       getter=operator.attrgetter('velocity')))
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_subclass_overriding_call(self):
+        class NotFartherFilter(DistanceFilter):
+            def __call__(self, approach):
+                return not super().__call__(approach)
+
+        distance = 0.1
+
+        expected = set(
+            approach for approach in self.approaches
+            if not approach.distance >= distance
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = [NotFartherFilter(operator.ge, distance)]
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_date_subclass_overriding_call(self):
+        class NotOnDateFilter(DateFilter):
+            def __call__(self, approach):
+                return not super().__call__(approach)
+
+        date = datetime.date(2020, 3, 2)
+
+        expected = set(
+            approach for approach in self.approaches
+            if approach.time.date() != date
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = [NotOnDateFilter(operator.eq, date)]
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_plain_callable_filter(self):
+        expected = set(
+            approach for approach in self.approaches
+            if approach.distance < 0.01
+        )
+        self.assertGreater(len(expected), 0)
+
+        received = set(self.db.query([lambda approach: approach.distance < 0.01]))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_subclass_declaring_attribute(self):
+        class SpeedFilter(AttributeFilter):
+            attribute = 'velocity'
+
+        velocity_threshold = 15
+
+        expected = set(
+            approach for approach in self.approaches
+            if approach.velocity >= velocity_threshold
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = [SpeedFilter(operator.ge, velocity_threshold)]
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_subclass_overriding_get(self):
+        class SpeedAsDistanceFilter(DistanceFilter):
+            @classmethod
+            def get(cls, approach):
+                return approach.velocity
+
+        velocity_threshold = 15
+
+        expected = set(
+            approach for approach in self.approaches
+            if approach.velocity >= velocity_threshold
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = [SpeedAsDistanceFilter(operator.ge, velocity_threshold)]
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_with_date_filter_on_date_values(self):
+        start_date = datetime.date(2020, 3, 1)
+        end_date = datetime.date(2020, 3, 15)
+
+        expected = set(
+            approach for approach in self.approaches
+            if start_date <= approach.time.date() <= end_date
+        )
+        self.assertGreater(len(expected), 0)
+
+        for filters in ([DateFilter(between, (start_date, end_date))],
+                        [DateFilter(operator.ge, start_date), DateFilter(operator.le, end_date)]):
+            received = set(self.db.query(filters))
+            self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+        expected = set(
+            approach for approach in self.approaches
+            if approach.time.date() == start_date
+        )
+        self.assertGreater(len(expected), 0)
+        received = set(self.db.query([DateFilter(operator.eq, start_date)]))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_date_filter_with_custom_getter_is_not_bisected(self):
+        # A custom getter means this `DateFilter` no longer compares dates, so
+        # `query` must not treat its value as a bound on the approach dates.
+        velocity_threshold = 15
+
+        expected = set(
+            approach for approach in self.approaches
+            if approach.velocity <= velocity_threshold
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = [DateFilter(operator.le, velocity_threshold,
+                              getter=operator.attrgetter('velocity'))]
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
 
 if __name__ == '__main__':
     unittest.main()